@@ -4,11 +4,13 @@ from datetime import datetime, timezone
 import re
 from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from .models import ChallengeAttempt, Chat, Model, ReloadLog, User
 
+_WEEK_IN_NAME_RE = re.compile(r"week\s*(\d+)", re.IGNORECASE)
+
 
 def _parse_datetime(value: Optional[str | int | float]) -> Optional[datetime]:
     if value in (None, ""):
@@ -101,7 +103,7 @@ def _infer_maip_from_name(name: Optional[str]) -> Tuple[Optional[str], Optional[
     difficulty_value: Optional[str] = None
     points_value: Optional[int] = None
 
-    week_match = re.search(r"week\s*(\d+)", text, flags=re.IGNORECASE)
+    week_match = _WEEK_IN_NAME_RE.search(text)
     if week_match:
         week_value = f"Week {week_match.group(1)}"
 
@@ -423,6 +425,33 @@ def truncate_table(session: Session, model) -> int:
     return result.rowcount or 0
 
 
+def build_reload_log_entry(
+    *,
+    resource: str,
+    mode: str,
+    status: str,
+    message: str | None,
+    rows: int | None,
+    previous_count: int | None = None,
+    new_records: int | None = None,
+    total_count: int | None = None,
+    duration_seconds: float | None = None,
+) -> Dict[str, object]:
+    """Return the column mapping for a reload log row, stamped with the finish time."""
+    return {
+        "resource": resource,
+        "mode": mode,
+        "status": status,
+        "message": message,
+        "rows_affected": rows,
+        "previous_count": previous_count,
+        "new_records": new_records,
+        "total_count": total_count,
+        "duration_seconds": duration_seconds,
+        "finished_at": datetime.now(timezone.utc),
+    }
+
+
 def record_reload_log(
     session: Session,
     *,
@@ -437,44 +466,51 @@ def record_reload_log(
     duration_seconds: float | None = None,
 ) -> ReloadLog:
     log = ReloadLog(
-        resource=resource,
-        mode=mode,
-        status=status,
-        message=message,
-        rows_affected=rows,
-        previous_count=previous_count,
-        new_records=new_records,
-        total_count=total_count,
-        duration_seconds=duration_seconds,
-        finished_at=datetime.now(timezone.utc),
+        **build_reload_log_entry(
+            resource=resource,
+            mode=mode,
+            status=status,
+            message=message,
+            rows=rows,
+            previous_count=previous_count,
+            new_records=new_records,
+            total_count=total_count,
+            duration_seconds=duration_seconds,
+        )
     )
     session.add(log)
     return log
 
 
+def insert_reload_logs(session: Session, entries: List[Dict[str, object]]) -> int:
+    """Bulk insert reload log rows produced by ``build_reload_log_entry``."""
+    if not entries:
+        return 0
+    session.execute(insert(ReloadLog), entries)
+    return len(entries)
+
+
 def get_row_count(session: Session, model) -> int:
     return session.scalar(select(func.count()).select_from(model)) or 0
 
 
+def _latest_reload_stmt():
+    return select(ReloadLog).order_by(ReloadLog.finished_at.desc().nullslast(), ReloadLog.id.desc())
+
+
 def get_latest_reload(session: Session, resource: str) -> ReloadLog | None:
-    stmt = (
-        select(ReloadLog)
-        .where(ReloadLog.resource == resource)
-        .order_by(ReloadLog.finished_at.desc().nullslast(), ReloadLog.id.desc())
-        .limit(1)
-    )
+    stmt = lambda_stmt(_latest_reload_stmt)
+    stmt += lambda s: s.where(ReloadLog.resource == resource).limit(1)
     return session.execute(stmt).scalars().first()
 
 
 def get_latest_reload_any(session: Session) -> ReloadLog | None:
-    stmt = select(ReloadLog).order_by(ReloadLog.finished_at.desc().nullslast(), ReloadLog.id.desc()).limit(1)
+    stmt = lambda_stmt(_latest_reload_stmt)
+    stmt += lambda s: s.limit(1)
     return session.execute(stmt).scalars().first()
 
 
 def get_recent_logs(session: Session, limit: int = 10) -> List[ReloadLog]:
-    stmt = (
-        select(ReloadLog)
-        .order_by(ReloadLog.finished_at.desc().nullslast(), ReloadLog.id.desc())
-        .limit(limit)
-    )
+    stmt = lambda_stmt(_latest_reload_stmt)
+    stmt += lambda s: s.limit(limit)
     return session.execute(stmt).scalars().all()
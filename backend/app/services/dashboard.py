@@ -33,7 +33,7 @@ PROJECT_ROOT = CURRENT_FILE.parents[3]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
-from .mission_analyzer import DATA_DIR, MissionAnalyzer, find_latest_export  # noqa: E402
+from .mission_analyzer import DATA_DIR, MissionAnalyzer, find_latest_export, load_json_file  # noqa: E402
 
 from ..schemas import (
     ChallengeAttempt,
@@ -58,6 +58,10 @@ from ..schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Display-name fallbacks used per exported row; compiled once at import.
+_WEEK_IN_NAME_RE = re.compile(r"week\s*(\d+)", re.IGNORECASE)
+_DIFFICULTY_IN_NAME_RE = re.compile(r"\b(easy|medium|hard)\b", re.IGNORECASE)
+
 
 @dataclass
 class MissionAnalysisContext:
@@ -81,6 +85,15 @@ def _normalize_to_utc(dt: Optional[datetime]) -> Optional[datetime]:
     return dt.astimezone(timezone.utc)
 
 
+def _format_export_timestamp(value: Any) -> Optional[str]:
+    """Render epoch seconds as ISO strings; other truthy values pass through as text."""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).isoformat()
+    return str(value)
+
+
 def _extract_model_metadata(records: Iterable[dict]) -> Tuple[Dict[str, str], Set[str], Dict[str, str], Dict[str, str], Dict[str, int], Dict[str, str]]:
     """
     Normalize a sequence of model records into lookup maps and mission classifications.
@@ -517,8 +530,7 @@ def _get_or_build_challenge_attempt_payloads(data_file: Optional[str] = None) ->
             target_file = data_file or find_latest_export()
             if target_file:
                 try:
-                    with open(target_file, "r", encoding="utf-8") as f:
-                        chats_payload = json.load(f)
+                    chats_payload = load_json_file(target_file)
                 except (FileNotFoundError, json.JSONDecodeError):
                     chats_payload = None
 
@@ -604,8 +616,7 @@ def build_mission_analysis_context(
                     )
                 logger.info("Using fallback export file: %s", target_file)
                 try:
-                    with open(target_file, "r", encoding="utf-8") as f:
-                        chats_payload = json.load(f)
+                    chats_payload = load_json_file(target_file)
                     data_source = "file"
                     persist_chats(chats_payload, mode="upsert")
                 except (FileNotFoundError, json.JSONDecodeError) as exc:
@@ -1180,14 +1191,14 @@ def _generate_export_data(
             # Get week for this challenge
             week = lookup_with_fallback(week_mapping, alias, primary_id, challenge_name) or ""
             if not week:
-                week_match = re.search(r"week\s*(\d+)", challenge_name, re.IGNORECASE)
+                week_match = _WEEK_IN_NAME_RE.search(challenge_name)
                 if week_match:
                     week = week_match.group(1)
 
             # Get difficulty for this challenge with regex fallback from the display name
             difficulty = lookup_with_fallback(difficulty_mapping, alias, primary_id, challenge_name) or ""
             if not difficulty:
-                diff_match = re.search(r"\b(easy|medium|hard)\b", challenge_name, re.IGNORECASE)
+                diff_match = _DIFFICULTY_IN_NAME_RE.search(challenge_name)
                 if diff_match:
                     difficulty = diff_match.group(1).capitalize()
             elif str(difficulty).lower() in default_points_by_difficulty:
@@ -1199,21 +1210,8 @@ def _generate_export_data(
                 points = default_points_by_difficulty.get(str(difficulty).lower())
 
             # Format timestamps as strings if they exist
-            datetime_started_str = None
-            datetime_completed_str = None
-            if datetime_started:
-                if isinstance(datetime_started, (int, float)):
-                    from datetime import datetime
-                    datetime_started_str = datetime.fromtimestamp(datetime_started).isoformat()
-                else:
-                    datetime_started_str = str(datetime_started)
-
-            if datetime_completed:
-                if isinstance(datetime_completed, (int, float)):
-                    from datetime import datetime
-                    datetime_completed_str = datetime.fromtimestamp(datetime_completed).isoformat()
-                else:
-                    datetime_completed_str = str(datetime_completed)
+            datetime_started_str = _format_export_timestamp(datetime_started)
+            datetime_completed_str = _format_export_timestamp(datetime_completed)
 
             export_rows.append({
                 "user_name": user_name,
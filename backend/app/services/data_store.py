@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 from time import perf_counter
-from threading import Lock
+from threading import Event, Lock, Thread
 from copy import deepcopy
 from typing import Dict, Iterable, List, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 
 from ..db import crud
 from ..db import get_db_session
@@ -15,12 +17,99 @@ from ..db.models import Chat as ChatModel
 from ..db.models import Model as ModelModel
 from ..db.models import ReloadLog
 from ..db.models import User as UserModel
-from .model_admin import collect_model_identifiers
+from .model_admin import collect_all_model_identifiers
 
 
 logger = logging.getLogger(__name__)
 _CHALLENGE_ATTEMPT_LOCK = Lock()
 
+# Reload log rows are queued and written in batches by a daemon thread so the
+# persist paths do not pay for a separate INSERT + commit per log entry.
+# Readers call ``flush_reload_logs`` first, so queued entries are always
+# visible to status queries issued after the write. A batch that fails to
+# write is kept in ``_RELOAD_LOG_RETRY`` and goes out first on the next flush.
+_RELOAD_LOG_BATCH_SIZE = 100
+_RELOAD_LOG_FLUSH_INTERVAL = 1.0
+_RELOAD_LOG_QUEUE: "queue.Queue[dict]" = queue.Queue()
+_RELOAD_LOG_RETRY: List[dict] = []  # guarded by _RELOAD_LOG_FLUSH_LOCK
+_RELOAD_LOG_FLUSH_LOCK = Lock()
+_RELOAD_LOG_WAKE = Event()
+_RELOAD_LOG_WORKER: Thread | None = None
+_RELOAD_LOG_WORKER_LOCK = Lock()
+
+
+def flush_reload_logs(raise_errors: bool = False) -> int:
+    """
+    Write every queued reload log entry to the database and return the count.
+
+    A failed batch is kept for the next flush instead of being dropped. The
+    background writer only logs the failure; with ``raise_errors`` the error
+    propagates, as it did when reload logs were written synchronously.
+    """
+    written = 0
+    with _RELOAD_LOG_FLUSH_LOCK:
+        while True:
+            batch: List[dict] = _RELOAD_LOG_RETRY[:_RELOAD_LOG_BATCH_SIZE]
+            del _RELOAD_LOG_RETRY[: len(batch)]
+            while len(batch) < _RELOAD_LOG_BATCH_SIZE:
+                try:
+                    batch.append(_RELOAD_LOG_QUEUE.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                break
+            try:
+                with get_db_session() as session:
+                    written += crud.insert_reload_logs(session, batch)
+            except Exception:
+                _RELOAD_LOG_RETRY[:0] = batch
+                if raise_errors:
+                    raise
+                logger.exception("Failed to write %d reload log entries; will retry", len(batch))
+                break
+    return written
+
+
+def _reload_log_worker() -> None:
+    while True:
+        _RELOAD_LOG_WAKE.wait(timeout=_RELOAD_LOG_FLUSH_INTERVAL)
+        _RELOAD_LOG_WAKE.clear()
+        flush_reload_logs()
+
+
+def _ensure_reload_log_worker() -> None:
+    global _RELOAD_LOG_WORKER
+    if _RELOAD_LOG_WORKER is not None and _RELOAD_LOG_WORKER.is_alive():
+        return
+    with _RELOAD_LOG_WORKER_LOCK:
+        if _RELOAD_LOG_WORKER is not None and _RELOAD_LOG_WORKER.is_alive():
+            return
+        _RELOAD_LOG_WORKER = Thread(target=_reload_log_worker, name="reload-log-writer", daemon=True)
+        _RELOAD_LOG_WORKER.start()
+
+
+def _enqueue_reload_log(**fields) -> ReloadLog:
+    entry = crud.build_reload_log_entry(**fields)
+    _RELOAD_LOG_QUEUE.put(entry)
+    _ensure_reload_log_worker()
+    if _RELOAD_LOG_QUEUE.qsize() >= _RELOAD_LOG_BATCH_SIZE:
+        _RELOAD_LOG_WAKE.set()
+    # Transient instance mirrors what will be stored so callers can echo it back.
+    return ReloadLog(**entry)
+
+
+atexit.register(flush_reload_logs)
+
+# Read paths reuse lambda statements so SQLAlchemy compiles each query once
+# and serves later executions from its statement cache.
+_CHAT_DATA_STMT = lambda_stmt(lambda: select(ChatModel.data))
+_CHALLENGE_ATTEMPTS_STMT = lambda_stmt(
+    lambda: select(ChallengeAttemptModel).order_by(ChallengeAttemptModel.chat_index, ChallengeAttemptModel.id)
+)
+_MODELS_STMT = lambda_stmt(lambda: select(ModelModel))
+_MODELS_WITH_WEEK_STMT = lambda_stmt(lambda: select(ModelModel).where(ModelModel.maip_week.is_not(None)))
+_USERS_STMT = lambda_stmt(lambda: select(UserModel))
+
 
 def persist_chats(records: Iterable[dict], mode: str = "upsert") -> int:
     start_time = perf_counter()
@@ -43,44 +132,41 @@ def persist_chats(records: Iterable[dict], mode: str = "upsert") -> int:
             else:
                 new_records = max(total_count - previous, 0)
             duration = perf_counter() - start_time
-            crud.record_reload_log(
-                session,
-                resource="chats",
-                mode=mode,
-                status="success",
-                message=None,
-                rows=rows,
-                previous_count=previous_count,
-                new_records=new_records,
-                total_count=total_count,
-                duration_seconds=duration,
-            )
-            logger.info(
-                "Persisted %s chat records in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
-                rows,
-                duration,
-                mode,
-                previous_count,
-                new_records,
-                total_count,
-            )
-            return rows
+        _enqueue_reload_log(
+            resource="chats",
+            mode=mode,
+            status="success",
+            message=None,
+            rows=rows,
+            previous_count=previous_count,
+            new_records=new_records,
+            total_count=total_count,
+            duration_seconds=duration,
+        )
+        logger.info(
+            "Persisted %s chat records in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
+            rows,
+            duration,
+            mode,
+            previous_count,
+            new_records,
+            total_count,
+        )
+        return rows
     except Exception as exc:
         duration = perf_counter() - start_time
         logger.exception("Failed to persist chats (mode=%s)", mode)
-        with get_db_session() as session:
-            crud.record_reload_log(
-                session,
-                resource="chats",
-                mode=mode,
-                status="error",
-                message=str(exc),
-                rows=None,
-                previous_count=previous_count,
-                new_records=None,
-                total_count=None,
-                duration_seconds=duration,
-            )
+        _enqueue_reload_log(
+            resource="chats",
+            mode=mode,
+            status="error",
+            message=str(exc),
+            rows=None,
+            previous_count=previous_count,
+            new_records=None,
+            total_count=None,
+            duration_seconds=duration,
+        )
         raise
 
 
@@ -105,44 +191,41 @@ def persist_users(records: Iterable[dict], mode: str = "upsert") -> int:
             else:
                 new_records = max(total_count - previous, 0)
             duration = perf_counter() - start_time
-            crud.record_reload_log(
-                session,
-                resource="users",
-                mode=mode,
-                status="success",
-                message=None,
-                rows=rows,
-                previous_count=previous_count,
-                new_records=new_records,
-                total_count=total_count,
-                duration_seconds=duration,
-            )
-            logger.info(
-                "Persisted %s user records in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
-                rows,
-                duration,
-                mode,
-                previous_count,
-                new_records,
-                total_count,
-            )
-            return rows
+        _enqueue_reload_log(
+            resource="users",
+            mode=mode,
+            status="success",
+            message=None,
+            rows=rows,
+            previous_count=previous_count,
+            new_records=new_records,
+            total_count=total_count,
+            duration_seconds=duration,
+        )
+        logger.info(
+            "Persisted %s user records in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
+            rows,
+            duration,
+            mode,
+            previous_count,
+            new_records,
+            total_count,
+        )
+        return rows
     except Exception as exc:
         duration = perf_counter() - start_time
         logger.exception("Failed to persist users (mode=%s)", mode)
-        with get_db_session() as session:
-            crud.record_reload_log(
-                session,
-                resource="users",
-                mode=mode,
-                status="error",
-                message=str(exc),
-                rows=None,
-                previous_count=previous_count,
-                new_records=None,
-                total_count=None,
-                duration_seconds=duration,
-            )
+        _enqueue_reload_log(
+            resource="users",
+            mode=mode,
+            status="error",
+            message=str(exc),
+            rows=None,
+            previous_count=previous_count,
+            new_records=None,
+            total_count=None,
+            duration_seconds=duration,
+        )
         raise
 
 
@@ -167,44 +250,41 @@ def persist_models(records: Iterable[dict], mode: str = "upsert") -> int:
             else:
                 new_records = max(total_count - previous, 0)
             duration = perf_counter() - start_time
-            crud.record_reload_log(
-                session,
-                resource="models",
-                mode=mode,
-                status="success",
-                message=None,
-                rows=rows,
-                previous_count=previous_count,
-                new_records=new_records,
-                total_count=total_count,
-                duration_seconds=duration,
-            )
-            logger.info(
-                "Persisted %s model records in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
-                rows,
-                duration,
-                mode,
-                previous_count,
-                new_records,
-                total_count,
-            )
-            return rows
+        _enqueue_reload_log(
+            resource="models",
+            mode=mode,
+            status="success",
+            message=None,
+            rows=rows,
+            previous_count=previous_count,
+            new_records=new_records,
+            total_count=total_count,
+            duration_seconds=duration,
+        )
+        logger.info(
+            "Persisted %s model records in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
+            rows,
+            duration,
+            mode,
+            previous_count,
+            new_records,
+            total_count,
+        )
+        return rows
     except Exception as exc:
         duration = perf_counter() - start_time
         logger.exception("Failed to persist models (mode=%s)", mode)
-        with get_db_session() as session:
-            crud.record_reload_log(
-                session,
-                resource="models",
-                mode=mode,
-                status="error",
-                message=str(exc),
-                rows=None,
-                previous_count=previous_count,
-                new_records=None,
-                total_count=None,
-                duration_seconds=duration,
-            )
+        _enqueue_reload_log(
+            resource="models",
+            mode=mode,
+            status="error",
+            message=str(exc),
+            rows=None,
+            previous_count=previous_count,
+            new_records=None,
+            total_count=None,
+            duration_seconds=duration,
+        )
         raise
 
 
@@ -229,74 +309,57 @@ def persist_challenge_attempts(records: Iterable[dict], mode: str = "upsert") ->
                 else:
                     new_records = max(total_count - previous, 0)
                 duration = perf_counter() - start_time
-                crud.record_reload_log(
-                    session,
-                    resource="challenge_attempts",
-                    mode=mode_normalized,
-                    status="success",
-                    message=None,
-                    rows=rows,
-                    previous_count=previous_count,
-                    new_records=new_records,
-                    total_count=total_count,
-                    duration_seconds=duration,
-                )
-                logger.info(
-                    "Persisted %s challenge attempts in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
-                    rows,
-                    duration,
-                    mode_normalized,
-                    previous_count,
-                    new_records,
-                    total_count,
-                )
-                return rows
+            _enqueue_reload_log(
+                resource="challenge_attempts",
+                mode=mode_normalized,
+                status="success",
+                message=None,
+                rows=rows,
+                previous_count=previous_count,
+                new_records=new_records,
+                total_count=total_count,
+                duration_seconds=duration,
+            )
+            logger.info(
+                "Persisted %s challenge attempts in %.2fs (mode=%s, previous=%s, new=%s, total=%s)",
+                rows,
+                duration,
+                mode_normalized,
+                previous_count,
+                new_records,
+                total_count,
+            )
+            return rows
         except Exception as exc:
             duration = perf_counter() - start_time
             logger.exception("Failed to persist challenge attempts (mode=%s)", mode_normalized)
-            with get_db_session() as session:
-                crud.record_reload_log(
-                    session,
-                    resource="challenge_attempts",
-                    mode=mode_normalized,
-                    status="error",
-                    message=str(exc),
-                    rows=None,
-                    previous_count=previous_count,
-                    new_records=None,
-                    total_count=None,
-                    duration_seconds=duration,
-                )
+            _enqueue_reload_log(
+                resource="challenge_attempts",
+                mode=mode_normalized,
+                status="error",
+                message=str(exc),
+                rows=None,
+                previous_count=previous_count,
+                new_records=None,
+                total_count=None,
+                duration_seconds=duration,
+            )
             raise
 
 
 def load_chats() -> List[dict]:
     with get_db_session() as session:
-        rows = session.execute(select(ChatModel.data)).scalars().all()
+        rows = session.execute(_CHAT_DATA_STMT).scalars().all()
     logger.debug("Loaded %d chats from database", len(rows))
     return list(rows)
 
 
 def load_challenge_attempts() -> List[dict]:
     with get_db_session() as session:
-        rows = (
-            session.execute(
-                select(ChallengeAttemptModel).order_by(
-                    ChallengeAttemptModel.chat_index, ChallengeAttemptModel.id
-                )
-            )
-            .scalars()
-            .all()
-        )
+        rows = session.execute(_CHALLENGE_ATTEMPTS_STMT).scalars().all()
+        models = session.execute(_MODELS_WITH_WEEK_STMT).scalars().all()
 
-    model_week_by_alias: Dict[str, str] = {}
-    with get_db_session() as session:
-        models = session.execute(select(ModelModel)).scalars().all()
-        for model in models:
-            if model.maip_week is None:
-                continue
-            for identifier in collect_model_identifiers(model):
-                model_week_by_alias[str(identifier).lower()] = str(model.maip_week)
+    model_week_by_alias: Dict[str, str] = dict(collect_all_model_identifiers(models))
 
     attempts: List[dict] = []
     for row in rows:
@@ -343,7 +406,7 @@ def load_users() -> Tuple[Dict[str, dict], Dict[str, dict]]:
         tuple(dict, dict): (user_map, raw_data_map)
     """
     with get_db_session() as session:
-        users = session.execute(select(UserModel)).scalars().all()
+        users = session.execute(_USERS_STMT).scalars().all()
 
     user_map: Dict[str, dict] = {}
     raw_map: Dict[str, dict] = {}
@@ -359,7 +422,7 @@ def load_users() -> Tuple[Dict[str, dict], Dict[str, dict]]:
 
 def load_models() -> List[dict]:
     with get_db_session() as session:
-        rows = session.execute(select(ModelModel)).scalars().all()
+        rows = session.execute(_MODELS_STMT).scalars().all()
 
     records: List[dict] = []
     for row in rows:
@@ -378,6 +441,7 @@ def load_models() -> List[dict]:
 
 
 def get_latest_status(resource: str | None = None) -> ReloadLog | None:
+    flush_reload_logs(raise_errors=True)
     with get_db_session() as session:
         if resource:
             log = crud.get_latest_reload(session, resource)
@@ -406,6 +470,7 @@ def get_row_counts() -> Dict[str, int]:
 
 
 def get_recent_logs(limit: int = 10) -> List[ReloadLog]:
+    flush_reload_logs(raise_errors=True)
     with get_db_session() as session:
         logs = crud.get_recent_logs(session, limit=limit)
     logger.debug("Fetched %d recent reload logs", len(logs))
@@ -424,19 +489,17 @@ def record_custom_reload(
     total_count: int | None = None,
     duration_seconds: float | None = None,
 ) -> ReloadLog:
-    with get_db_session() as session:
-        log = crud.record_reload_log(
-            session,
-            resource=resource,
-            mode=mode,
-            status=status,
-            message=message,
-            rows=rows,
-            previous_count=previous_count,
-            new_records=new_records,
-            total_count=total_count,
-            duration_seconds=duration_seconds,
-        )
+    log = _enqueue_reload_log(
+        resource=resource,
+        mode=mode,
+        status=status,
+        message=message,
+        rows=rows,
+        previous_count=previous_count,
+        new_records=new_records,
+        total_count=total_count,
+        duration_seconds=duration_seconds,
+    )
     logger.info(
         "Recorded custom reload summary resource=%s mode=%s status=%s rows=%s total=%s duration=%.2fs",
         resource,
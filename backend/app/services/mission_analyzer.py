@@ -7,15 +7,184 @@ dashboard. The goal is to provide a reusable, testable service layer that can
 feed both CLI tools and the FastAPI backend.
 """
 
+import heapq
 import json
+import mmap
+import os
 import re
+import sys
 from collections import defaultdict
-from copy import deepcopy
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback for bare CLI installs
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 DATA_DIR = PROJECT_ROOT / "data"
 
+_MISSING = object()
+
+
+def _is_not_none(value):
+    """Lookup predicate for mappings where falsy values such as ``0`` are real."""
+    return value is not None
+
+
+def _created_at_sort_key(record):
+    """
+    Sort key for a record's ``created_at``, which exports give as epoch
+    numbers or as strings.
+
+    Numeric and ISO 8601 strings become epoch seconds so mixed exports still
+    compare; missing or unparseable values sort first, as ``0``.
+    """
+    value = record.get("created_at")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return 0
+    return 0
+
+
+class _UserStatsTable(dict):
+    """
+    ``user_id -> stats`` mapping that creates entries on first access.
+
+    Unlike ``defaultdict`` the factory receives the missing key, so each entry
+    is stamped with its ``user_id`` once instead of on every recorded attempt.
+    """
+
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory
+
+    def __missing__(self, user_id):
+        entry = self._factory(user_id)
+        self[user_id] = entry
+        return entry
+
+
+def _copy_attempt_record(record):
+    """
+    Copy a mission attempt without duplicating its transcript.
+
+    The analyzer only mutates the top-level record and its ``mission_info``,
+    so those are copied while message dicts stay shared with the source data.
+    Deep-copying every transcript used to double the memory held by attempts.
+    """
+    copied = dict(record)
+    mission_info = copied.get("mission_info")
+    if isinstance(mission_info, dict):
+        copied["mission_info"] = dict(mission_info)
+    messages = copied.get("messages")
+    if isinstance(messages, list):
+        copied["messages"] = list(messages)
+    return copied
+
+
+def load_json_file(path):
+    """
+    Parse a JSON file, preferring ``orjson`` when it is installed.
+
+    ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError`` so callers
+    handle malformed files the same way regardless of the parser used. The
+    orjson path parses straight from a read-only memory map, so large exports
+    never hold a second heap copy of the raw bytes next to the parsed objects.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap rejects empty files; let the parser raise its usual error.
+                return orjson.loads(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _keyword_trie_pattern(keywords):
+    """
+    Build a regex that matches any of ``keywords`` with shared prefixes factored out.
+
+    A flat ``a|b|c`` alternation makes the engine retry every keyword at each
+    position; folding the keywords into a trie means each character is tested
+    against at most one branch per prefix, which behaves like an Aho-Corasick
+    scan without an extra dependency.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node):
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+# Compiled once at import; used for every mission_info extraction.
+_WEEK_NUMBER_RE = re.compile(r"(\d+)")
+_CHALLENGE_NUMBER_RE = re.compile(r"challenge[\s\-_]*(\d+)")
+
+
+@lru_cache(maxsize=256)
+def _parse_week_number(week_value):
+    """Return the first integer in a week label such as ``"Week 3"``, or None."""
+    match = _WEEK_NUMBER_RE.search(week_value)
+    return int(match.group(1)) if match else None
+
+
+# Mission model patterns
+_MISSION_PATTERNS = (
+    r"maip.*challenge",
+    r"maip.*week",
+    r".*mission.*",
+    r".*challenge.*",
+)
+# One alternation so each model string is scanned in a single pass.
+_MISSION_PATTERN_RE = re.compile("|".join(f"(?:{pattern})" for pattern in _MISSION_PATTERNS))
+
+# Success indicators (keywords in AI responses that indicate success), in
+# lowercase so they match the lowercased message content.
+_SUCCESS_KEYWORDS = (
+    "mission accomplished",
+    "challenge complete",
+    "challenge completed",
+    "mission_code:314-ghost",
+    "mission code:314 ghost",
+    "mission complete",
+    "mission completed",
+    "perfect mission",
+    "mission evaluation complete",
+    "challenges complete",
+    "challenges completed",
+)
+# Content is lowercased before matching: a case-sensitive pattern keeps the
+# regex engine's literal-prefix scan, which IGNORECASE disables.
+_SUCCESS_KEYWORD_RE = re.compile(_keyword_trie_pattern(_SUCCESS_KEYWORDS))
+
 
 class MissionAnalyzer:
     """
@@ -113,33 +282,33 @@ class MissionAnalyzer:
         self.week_mapping = {str(alias): str(week) for alias, week in (week_mapping or {}).items()}
         self.points_mapping = {str(alias): int(pts) for alias, pts in (points_mapping or {}).items()}
         self.difficulty_mapping = {str(alias): str(diff) for alias, diff in (difficulty_mapping or {}).items()}
+        # Case-insensitive fallbacks; the first key wins, as in a linear scan.
+        self._week_mapping_lower = {}
+        for alias, week in self.week_mapping.items():
+            self._week_mapping_lower.setdefault(alias.lower(), week)
+        self._points_mapping_lower = {}
+        for alias, pts in self.points_mapping.items():
+            self._points_mapping_lower.setdefault(alias.lower(), pts)
+        # Model strings repeat across thousands of chats/messages, so mission
+        # resolution is memoized per instance (the mappings above are fixed).
+        self._mission_model_id_cache = {}
+        self._mission_info_cache = {}
+        self._canonical_key_cache = {}
+        self._mission_detail_cache = {}
+        self._filter_match_cache = {}
+        self._week_lookup_cache = {}
+        self._primary_identifier_cache = {}
+        self._alias_cache = {}
+        # Ordered user ids seen in ``self.data``; filled during analyze_missions.
+        self._data_user_ids = None
+        self._data_user_ids_source = None
         # Tracks per-user aggregates used to build leaderboard and summaries.
-        self.user_stats = defaultdict(self._create_user_stats_entry)
-
-        # Mission model patterns
-        self.mission_patterns = [
-            r"maip.*challenge",
-            r"maip.*week",
-            r".*mission.*",
-            r".*challenge.*",
-        ]
+        self.user_stats = _UserStatsTable(self._create_user_stats_entry)
 
-        # Success indicators (keywords in AI responses that indicate success)
-        self.success_keywords = [
-            "mission accomplished",
-            "challenge complete",
-            "challenge completed",
-            "mission_code:314-ghost",
-            "mission code:314 ghost",
-            "mission complete",
-            "mission completed",
-            "perfect mission",
-            "mission evaluation complete",
-            "challenges complete",
-            "challenges completed",
-        ]
-        # Normalize keywords so substring checks remain case-insensitive.
-        self.success_keywords = [keyword.lower() for keyword in self.success_keywords]
+        # Mission model patterns and success keywords. These are the module
+        # tuples the compiled regexes are built from, exposed read-only.
+        self.mission_patterns = _MISSION_PATTERNS
+        self.success_keywords = _SUCCESS_KEYWORDS
 
         if user_names:
             self.user_names.update(user_names)
@@ -149,14 +318,14 @@ class MissionAnalyzer:
         if not self.data:
             self.load_data()
 
-    def _create_user_stats_entry(self):
+    def _create_user_stats_entry(self, user_id=""):
         """
         Provide a fresh container for per-user aggregation stats.
         """
         return {
-            "user_id": "",
-            "missions_attempted": [],
-            "missions_completed": [],
+            "user_id": user_id,
+            "missions_attempted": set(),
+            "missions_completed": set(),
             "completed_mission_models": [],  # Track models of completed missions for points
             "missions_attempted_details": [],  # List of {name, week, mission_id} for attempted missions
             "missions_completed_details": [],  # List of {name, week, mission_id} for completed missions
@@ -190,10 +359,9 @@ class MissionAnalyzer:
             ``verbose`` is enabled.
         """
         try:
-            with open(self.user_names_file, "r", encoding="utf-8") as f:
-                file_names = json.load(f)
+            file_names = load_json_file(self.user_names_file)
             # Remove comment fields
-            file_names = {k: v for k, v in file_names.items() if not k.startswith("_")}
+            file_names = {sys.intern(k): v for k, v in file_names.items() if not k.startswith("_")}
             if merge:
                 original = len(self.user_names)
                 self.user_names.update(file_names)
@@ -228,10 +396,11 @@ class MissionAnalyzer:
         Usage:
             ``analyzer.get_user_name(chat["user_id"])`` inside aggregation loops.
         """
-        if user_id in self.user_names:
-            return self.user_names[user_id]
+        name = self.user_names.get(user_id, _MISSING)
+        if name is not _MISSING:
+            return name
         # Show first 13 characters of UUID for better identification
-        return user_id[:13] if len(user_id) > 13 else user_id
+        return user_id[:13]
 
     def load_data(self):
         """
@@ -254,8 +423,7 @@ class MissionAnalyzer:
             return
 
         try:
-            with open(self.json_file, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
+            self.data = load_json_file(self.json_file)
             if self.verbose:
                 print(f"Loaded {len(self.data)} chats from {self.json_file}")
         except FileNotFoundError:
@@ -273,8 +441,13 @@ class MissionAnalyzer:
         """
         if model_name is None:
             return None
-        model_str = str(model_name)
-        return self.model_aliases_lower.get(model_str.lower())
+        if not isinstance(model_name, str):
+            return self.model_aliases_lower.get(str(model_name).lower())
+        alias = self._alias_cache.get(model_name, _MISSING)
+        if alias is _MISSING:
+            alias = self.model_aliases_lower.get(model_name.lower())
+            self._alias_cache[model_name] = alias
+        return alias
 
     def _resolve_mission_alias(self, model_name):
         """
@@ -288,6 +461,15 @@ class MissionAnalyzer:
         """
         Map a model string to the canonical identifier used for mission detection.
         """
+        if not isinstance(model_name, str):
+            return self._resolve_primary_identifier_uncached(model_name)
+        primary = self._primary_identifier_cache.get(model_name)
+        if primary is None:
+            primary = self._resolve_primary_identifier_uncached(model_name)
+            self._primary_identifier_cache[model_name] = primary
+        return primary
+
+    def _resolve_primary_identifier_uncached(self, model_name):
         alias = self._resolve_alias(model_name)
         if alias:
             return self.alias_to_primary.get(alias, alias)
@@ -299,11 +481,7 @@ class MissionAnalyzer:
         """
         Fallback regex heuristics for mission detection when metadata is unavailable.
         """
-        model_lower = str(model_name).lower()
-        for pattern in self.mission_patterns:
-            if re.search(pattern, model_lower):
-                return True
-        return False
+        return _MISSION_PATTERN_RE.search(str(model_name).lower()) is not None
 
     def _resolve_display_name(self, model_name):
         """
@@ -325,33 +503,56 @@ class MissionAnalyzer:
         """
         if mission_model is None:
             return None
+        if not isinstance(mission_model, str):
+            return self._lookup_mapping(mission_model, self.week_mapping, self._week_mapping_lower) or None
 
-        week = self.week_mapping.get(mission_model)
-        if week:
-            return week
+        week = self._week_lookup_cache.get(mission_model, _MISSING)
+        if week is _MISSING:
+            week = self._lookup_mapping(mission_model, self.week_mapping, self._week_mapping_lower) or None
+            self._week_lookup_cache[mission_model] = week
+        return week
 
-        primary = self._resolve_primary_identifier(mission_model)
+    def _lookup_mapping(self, model_name, mapping, mapping_lower=None, allow_falsy=False):
+        """
+        Resolve model metadata by exact key, primary identifier, stored alias and,
+        when ``mapping_lower`` is given, a case-insensitive key match.
+
+        Empty values fall through to the next lookup unless ``allow_falsy`` is
+        set (points, where only ``None`` means missing). Returns the last value
+        probed when nothing matches.
+        """
+        found = _is_not_none if allow_falsy else bool
+
+        value = mapping.get(model_name)
+        if found(value):
+            return value
+
+        primary = self._resolve_primary_identifier(model_name)
         if primary:
-            week = self.week_mapping.get(primary)
-            if week:
-                return week
+            value = mapping.get(primary)
+            if found(value):
+                return value
 
-        alias = self._resolve_alias(mission_model)
+        alias = self._resolve_alias(model_name)
         if alias:
-            week = self.week_mapping.get(alias)
-            if week:
-                return week
-
-        model_lower = str(mission_model).lower()
-        for key, val in self.week_mapping.items():
-            if key.lower() == model_lower:
-                return val
-        return None
+            value = mapping.get(alias)
+            if found(value):
+                return value
+
+        if mapping_lower is not None:
+            value = mapping_lower.get(str(model_name).lower(), value)
+        return value
 
     def is_mission_model(self, model_name):
         """
         Determine whether a model string represents a mission challenge.
         """
+        if not isinstance(model_name, str):
+            return self._is_mission_model_uncached(model_name)
+        # Shares the resolution cache so each distinct string is classified once.
+        return self.get_mission_model_id(model_name) is not None
+
+    def _is_mission_model_uncached(self, model_name):
         if self._resolve_mission_alias(model_name):
             return True
         primary = self._resolve_primary_identifier(model_name)
@@ -364,6 +565,15 @@ class MissionAnalyzer:
         Return the canonical mission model ID when available, otherwise the original
         string if it satisfies the heuristic mission patterns.
         """
+        if not isinstance(model_name, str):
+            return self._get_mission_model_id_uncached(model_name)
+        cached = self._mission_model_id_cache.get(model_name, _MISSING)
+        if cached is _MISSING:
+            cached = self._get_mission_model_id_uncached(model_name)
+            self._mission_model_id_cache[model_name] = cached
+        return cached
+
+    def _get_mission_model_id_uncached(self, model_name):
         alias = self._resolve_mission_alias(model_name)
         if alias:
             return self.alias_to_primary.get(alias, alias)
@@ -384,28 +594,26 @@ class MissionAnalyzer:
         if isinstance(entry, str):
             return entry
         if isinstance(entry, dict):
-            preferred_keys = (
-                "slug",
-                "model",
-                "model_slug",
-                "modelSlug",
-                "preset",
-                "name",
-                "display_name",
-                "displayName",
-                "id",
+            # Preferred keys in priority order; ``or`` returns the first truthy one.
+            value = (
+                entry.get("slug")
+                or entry.get("model")
+                or entry.get("model_slug")
+                or entry.get("modelSlug")
+                or entry.get("preset")
+                or entry.get("name")
+                or entry.get("display_name")
+                or entry.get("displayName")
+                or entry.get("id")
             )
-            for key in preferred_keys:
-                value = entry.get(key)
-                if value:
-                    return value
+            if value:
+                return value
             # Fallback to nested identifiers commonly used in OpenWebUI exports.
             info = entry.get("info")
             if isinstance(info, dict):
-                for key in ("id", "slug", "model"):
-                    value = info.get(key)
-                    if value:
-                        return value
+                value = info.get("id") or info.get("slug") or info.get("model")
+                if value:
+                    return value
         return str(entry)
 
     def extract_mission_info(self, model_name):
@@ -424,43 +632,30 @@ class MissionAnalyzer:
         Notes:
             Week is determined from maip_week field in model metadata (via week_mapping).
             Challenge number is extracted from model name as a fallback.
+            Results are memoized per model string; callers receive a fresh copy.
         """
+        if not isinstance(model_name, str):
+            return self._extract_mission_info_uncached(model_name)
+        cached = self._mission_info_cache.get(model_name)
+        if cached is None:
+            cached = self._extract_mission_info_uncached(model_name)
+            self._mission_info_cache[model_name] = cached
+        return dict(cached)
+
+    def _extract_mission_info_uncached(self, model_name):
+        model_lower = str(model_name).lower()
+
         # Get week from week_mapping (which comes from maip_week in model metadata)
         week = None
-        week_str = self.week_mapping.get(model_name)
-
-        # Try the primary identifier
-        if not week_str:
-            primary = self._resolve_primary_identifier(model_name)
-            if primary:
-                week_str = self.week_mapping.get(primary)
-
-        # Try the resolved alias
-        if not week_str:
-            alias = self._resolve_alias(model_name)
-            if alias:
-                week_str = self.week_mapping.get(alias)
-
-        # Try lowercase variation
-        if not week_str:
-            model_lower = str(model_name).lower()
-            for key, val in self.week_mapping.items():
-                if key.lower() == model_lower:
-                    week_str = val
-                    break
+        week_str = self._lookup_mapping(model_name, self.week_mapping, self._week_mapping_lower)
 
-        # Convert week string to int (supports "Week 1" formats)
+        # Convert week string to int (supports "Week 1" formats); week labels
+        # are shared by many models so the parse is cached per label.
         if week_str:
-            match = re.search(r"(\d+)", str(week_str))
-            if match:
-                try:
-                    week = int(match.group(1))
-                except (ValueError, TypeError):
-                    week = None
+            week = _parse_week_number(week_str)
 
         # Extract challenge number from model name as fallback
-        model_str = str(model_name).lower()
-        challenge_match = re.search(r"challenge[\s\-_]*(\d+)", model_str)
+        challenge_match = _CHALLENGE_NUMBER_RE.search(model_lower)
         challenge = int(challenge_match.group(1)) if challenge_match else None
 
         display_name = self._resolve_display_name(model_name) or model_name
@@ -536,6 +731,10 @@ class MissionAnalyzer:
         """
         Resolve a mission identifier from a mixed model representation.
         """
+        if isinstance(entry, str):
+            # A bare string is its own single candidate.
+            candidate = entry.strip()
+            return self.get_mission_model_id(candidate) if candidate else None
         for candidate in self._extract_model_candidates(entry):
             mission_id = self.get_mission_model_id(candidate)
             if mission_id:
@@ -549,6 +748,14 @@ class MissionAnalyzer:
         if not isinstance(message, dict):
             return None
 
+        # Most messages carry a plain ``model`` string, which is always the
+        # first candidate; resolve it straight from the cache.
+        model_value = message.get("model")
+        if isinstance(model_value, str):
+            mission_id = self.get_mission_model_id(model_value.strip())
+            if mission_id:
+                return mission_id
+
         seen = set()
         candidates = []
         for key in ("model", "model_id", "modelId", "modelSlug", "model_slug"):
@@ -588,9 +795,21 @@ class MissionAnalyzer:
     def _canonical_mission_key(self, mission_model):
         """
         Produce a consistent lowercase key for mission comparisons.
+
+        Keys are cached per model string; the success scan asks for the key of
+        every assistant message, so each distinct string is lowercased once.
         """
         if mission_model is None:
             return None
+        if isinstance(mission_model, str):
+            key = self._canonical_key_cache.get(mission_model)
+            if key is None:
+                key = self._canonical_mission_key_uncached(mission_model)
+                self._canonical_key_cache[mission_model] = key
+            return key
+        return self._canonical_mission_key_uncached(mission_model)
+
+    def _canonical_mission_key_uncached(self, mission_model):
         primary = self._resolve_primary_identifier(mission_model)
         if primary:
             return str(primary).lower()
@@ -613,7 +832,16 @@ class MissionAnalyzer:
         """
         if not filter_value:
             return True
-
+        if isinstance(mission_model, str) and isinstance(filter_value, str):
+            cache_key = (mission_model, filter_value)
+            matched = self._filter_match_cache.get(cache_key)
+            if matched is None:
+                matched = self._mission_matches_filter_uncached(mission_model, filter_value)
+                self._filter_match_cache[cache_key] = matched
+            return matched
+        return self._mission_matches_filter_uncached(mission_model, filter_value)
+
+    def _mission_matches_filter_uncached(self, mission_model, filter_value):
         # Get the mission info for this model
         mission_info = self.extract_mission_info(mission_model)
         mission_display_name = mission_info["mission_id"]
@@ -661,10 +889,16 @@ class MissionAnalyzer:
         if mission_model is not None:
             return self.check_success_for_mission(messages, mission_model)
 
-        for msg in self._iter_success_candidate_messages(messages):
-            content = msg.get("content", "").lower()
-            if any(keyword in content for keyword in self.success_keywords):
+        # Confirmations usually close the transcript, so scan from the end. A
+        # match only counts once an earlier assistant reply shows it is not the
+        # intro, and that reply needs no keyword scan of its own.
+        matched = False
+        for msg in reversed(messages):
+            if msg.get("role") != "assistant":
+                continue
+            if matched:
                 return True
+            matched = _SUCCESS_KEYWORD_RE.search(msg.get("content", "").lower()) is not None
         return False
 
     def _build_attempt_identifier(self, chat_id, mission_model, mission_info, chat_index):
@@ -692,33 +926,40 @@ class MissionAnalyzer:
         mission_key = self._canonical_mission_key(mission_model)
         if mission_key is None:
             return False
+        return mission_key in self._completed_mission_keys(messages, {mission_key})
 
-        for msg in self._iter_success_candidate_messages(messages, mission_key=mission_key):
-            content = msg.get("content", "").lower()
-            if any(keyword in content for keyword in self.success_keywords):
-                return True
-        return False
-
-    def _iter_success_candidate_messages(self, messages, mission_key=None):
+    def _completed_mission_keys(self, messages, mission_keys):
         """
-        Yield assistant messages excluding the first assistant response.
-        When mission_key is provided, only messages tied to that mission are considered,
-        and the first assistant message for that mission is skipped.
+        Return the subset of ``mission_keys`` completed within ``messages``.
+
+        A mission counts as complete when any of its assistant replies other
+        than the first contains a success keyword. The transcript is walked
+        once from the end, where confirmations usually sit, and the walk stops
+        as soon as every key is complete.
         """
-        first_assistant_seen = False
-        for msg in messages:
+        completed = set()
+        if not mission_keys:
+            return completed
+
+        # Keys whose latest matching reply may still be the mission's intro;
+        # any earlier reply for the same mission confirms the completion.
+        matched = set()
+        for msg in reversed(messages):
             if msg.get("role") != "assistant":
                 continue
-            if mission_key is not None:
-                msg_mission = self._get_message_mission_id(msg)
-                if msg_mission is None:
-                    continue
-                if self._canonical_mission_key(msg_mission) != mission_key:
-                    continue
-            if not first_assistant_seen:
-                first_assistant_seen = True
+            msg_mission = self._get_message_mission_id(msg)
+            if msg_mission is None:
+                continue
+            key = self._canonical_mission_key(msg_mission)
+            if key not in mission_keys or key in completed:
                 continue
-            yield msg
+            if key in matched:
+                completed.add(key)
+                if len(completed) == len(mission_keys):
+                    break
+            elif _SUCCESS_KEYWORD_RE.search(msg.get("content", "").lower()):
+                matched.add(key)
+        return completed
 
     def _register_mission_attempt(
         self,
@@ -740,12 +981,16 @@ class MissionAnalyzer:
         self.mission_chats.append(mission_data)
 
         stats = self.user_stats[user_id]
-        stats["user_id"] = user_id
 
+        # Details are kept once per mission (first attempt wins), which is all
+        # get_leaderboard reads, instead of growing with every attempt. Each
+        # user gets a copy, since mission_detail may be shared across attempts.
         mission_id = mission_detail.get("mission_id")
-        if mission_id is not None:
-            stats["missions_attempted"].append(mission_id)
-        stats["missions_attempted_details"].append(mission_detail)
+        if mission_id is None:
+            stats["missions_attempted_details"].append(dict(mission_detail))
+        elif mission_id not in stats["missions_attempted"]:
+            stats["missions_attempted"].add(mission_id)
+            stats["missions_attempted_details"].append(dict(mission_detail))
 
         user_message_count = mission_data.get("user_message_count") or 0
         stats["total_attempts"] += 1
@@ -759,8 +1004,8 @@ class MissionAnalyzer:
                 completion_key = str(mission_data.get("model")).lower()
             if completion_key not in stats["credited_completion_keys"]:
                 if mission_id is not None:
-                    stats["missions_completed"].append(mission_id)
-                    stats["missions_completed_details"].append(mission_detail)
+                    stats["missions_completed"].add(mission_id)
+                    stats["missions_completed_details"].append(dict(mission_detail))
                 stats["completed_mission_models"].append(mission_data.get("model"))
                 stats["total_completions"] += 1
                 stats["credited_completion_keys"].add(completion_key)
@@ -774,14 +1019,29 @@ class MissionAnalyzer:
         if current_last is None:
             stats["last_attempt"] = conversation_updated_at
         else:
-            try:
-                current_val = float(current_last) if isinstance(current_last, (int, float)) else 0
-                new_val = float(conversation_updated_at) if isinstance(conversation_updated_at, (int, float)) else 0
-                if new_val > current_val:
-                    stats["last_attempt"] = conversation_updated_at
-            except (ValueError, TypeError):
+            # Only numeric timestamps are compared; anything else counts as 0.
+            # float() of an int/float cannot raise, so no try/except is needed.
+            current_val = float(current_last) if isinstance(current_last, (int, float)) else 0
+            new_val = float(conversation_updated_at) if isinstance(conversation_updated_at, (int, float)) else 0
+            if new_val > current_val:
                 stats["last_attempt"] = conversation_updated_at
 
+    @staticmethod
+    def _normalize_attempt_filters(filter_status, filter_week):
+        """
+        Resolve per-call filter values once so the per-chat loop only compares.
+
+        Returns ``(status_filter, week_filter)``. ``status_filter`` is None when
+        the status filter is unset or "not_attempted"; that case needs every
+        mission chat so get_challenge_results() can find users who have NOT
+        attempted. ``week_filter`` is the filter week as a string, or None.
+        """
+        status_filter = filter_status.lower() if filter_status else None
+        if status_filter == "not_attempted":
+            status_filter = None
+        week_filter = str(filter_week) if filter_week else None
+        return status_filter, week_filter
+
     def analyze_missions(self, filter_challenge=None, filter_user=None, filter_status=None, filter_week=None):
         """
         Inspect chats and populate mission-related aggregates.
@@ -815,128 +1075,190 @@ class MissionAnalyzer:
             handle exports where model attribution differs.
         """
         self.mission_chats = []
-        self.user_stats = defaultdict(self._create_user_stats_entry)
+        self.user_stats = _UserStatsTable(self._create_user_stats_entry)
+        status_filter, week_filter = self._normalize_attempt_filters(filter_status, filter_week)
 
-        for i, item in enumerate(self.data, 1):
-            chat = item.get("chat", {})
-            models = chat.get("models") or []
-            messages = chat.get("messages", [])
+        data_user_ids = {}
+        classified = (
+            self._classify_chat(i, item, filter_challenge, filter_user, status_filter, week_filter)
+            for i, item in enumerate(self.data, 1)
+        )
 
-            user_id = item.get("user_id", "Unknown")
-            if filter_user and user_id != filter_user:
-                continue
+        for user_id, attempts in classified:
+            if user_id and user_id != "Unknown":
+                data_user_ids[user_id] = None
+            for mission_data, mission_detail, mission_key in attempts:
+                self._register_mission_attempt(
+                    mission_data=mission_data,
+                    mission_detail=mission_detail,
+                    mission_key=mission_key,
+                    completed=mission_data["completed"],
+                    created_at=mission_data["created_at"],
+                    updated_at=mission_data["updated_at"],
+                )
+
+        self._data_user_ids = list(data_user_ids)
+        self._data_user_ids_source = (self.data, len(self.data))
+        return len(self.mission_chats)
 
-            conversation_missions = []
-            mission_message_map = defaultdict(list)
+    def _classify_chat(self, i, item, filter_challenge, filter_user, status_filter, week_filter):
+        """
+        Classify one chat into mission attempts without touching shared state.
 
-            model_entries = models if isinstance(models, (list, tuple, set)) else [models]
-            for entry in model_entries:
-                mission_id = self._get_mission_from_entry(entry)
-                if mission_id and mission_id not in conversation_missions:
+        Returns ``(user_id, attempts)`` where each attempt is a
+        ``(mission_data, mission_detail, mission_key)`` tuple ready for
+        ``_register_mission_attempt``.
+        """
+        attempts = []
+        chat = item.get("chat", {})
+        models = chat.get("models") or []
+        messages = chat.get("messages", [])
+
+        user_id = item.get("user_id", "Unknown")
+        if isinstance(user_id, str):
+            # Every chat decodes its own copy of the id; share one object
+            # across mission_chats, user_stats and the id list.
+            user_id = sys.intern(user_id)
+        if filter_user and user_id != filter_user:
+            return user_id, attempts
+
+        conversation_missions = []
+        mission_message_map = defaultdict(list)
+
+        model_entries = models if isinstance(models, (list, tuple, set)) else [models]
+        for entry in model_entries:
+            mission_id = self._get_mission_from_entry(entry)
+            if mission_id and mission_id not in conversation_missions:
+                conversation_missions.append(mission_id)
+
+        last_active_mission = None
+        for msg in messages:
+            mission_id = self._get_message_mission_id(msg)
+            if mission_id:
+                if mission_id not in conversation_missions:
                     conversation_missions.append(mission_id)
+                mission_message_map[mission_id].append(msg)
+                last_active_mission = mission_id
+            else:
+                if msg.get("role") == "assistant":
+                    last_active_mission = None
+                elif last_active_mission:
+                    mission_message_map[last_active_mission].append(msg)
 
-            last_active_mission = None
-            for msg in messages:
-                mission_id = self._get_message_mission_id(msg)
-                if mission_id:
-                    if mission_id not in conversation_missions:
-                        conversation_missions.append(mission_id)
-                    mission_message_map[mission_id].append(msg)
-                    last_active_mission = mission_id
-                else:
-                    if msg.get("role") == "assistant":
-                        last_active_mission = None
-                    elif last_active_mission:
-                        mission_message_map[last_active_mission].append(msg)
-
-            if not conversation_missions:
-                continue
+        if not conversation_missions:
+            return user_id, attempts
 
-            for mission_id in conversation_missions:
-                mission_message_map.setdefault(mission_id, [])
+        for mission_id in conversation_missions:
+            mission_message_map.setdefault(mission_id, [])
 
-            title = item.get("title", "Untitled")
-            created_at = item.get("created_at")
-            updated_at = item.get("updated_at")
+        title = item.get("title", "Untitled")
+        created_at = item.get("created_at")
+        updated_at = item.get("updated_at")
 
-            for mission_model in conversation_missions:
-                mission_info = self.extract_mission_info(mission_model)
-                mission_messages = mission_message_map.get(mission_model, [])
-                mission_key = self._canonical_mission_key(mission_model)
-                completed = self.check_success(messages, mission_model=mission_model)
+        candidates = []
+        for mission_model in conversation_missions:
+            if filter_challenge and not self._mission_matches_filter(mission_model, filter_challenge):
+                continue
 
-                if filter_challenge and not self._mission_matches_filter(mission_model, filter_challenge):
+            mission_info = self.extract_mission_info(mission_model)
+            if week_filter is not None:
+                model_week = mission_info.get("week")
+                if model_week is None:
+                    model_week = self._lookup_week_for_model(mission_model)
+                if not model_week or str(model_week) != week_filter:
                     continue
+            candidates.append((mission_model, mission_info, self._canonical_mission_key(mission_model)))
 
-                # Skip status filtering for "not_attempted" - we need all mission chats
-                # to determine who has NOT attempted in get_challenge_results()
-                if filter_status and filter_status.lower() != "not_attempted":
-                    status_filter = filter_status.lower()
-                    if status_filter == "completed" and not completed:
-                        continue
-                    if status_filter == "attempted" and completed:
-                        continue
+        if not candidates:
+            return user_id, attempts
 
-                if filter_week:
-                    model_week = mission_info.get("week")
-                    if model_week is None:
-                        model_week = self._lookup_week_for_model(mission_model)
-                    if not model_week or str(model_week) != str(filter_week):
-                        continue
+        # The success scan is the costliest step, so it runs once per chat and
+        # only for missions that survived the structural filters above.
+        completed_keys = self._completed_mission_keys(
+            messages, {mission_key for _, _, mission_key in candidates if mission_key is not None}
+        )
 
-                if mission_messages:
-                    relevant_messages = mission_messages
-                else:
-                    relevant_messages = [
-                        msg for msg in messages if self._canonical_mission_key(self._get_message_mission_id(msg)) == mission_key
-                    ]
-                    if not relevant_messages and len(conversation_missions) == 1:
-                        relevant_messages = messages
-
-                mission_message_count = len(relevant_messages)
-                mission_user_message_count = self._count_user_messages(relevant_messages)
-
-                chat_id = item.get("id") or chat.get("id") or item.get("chat_id") or f"chat-{i}"
-                mission_data = {
-                    "chat_num": i,
-                    "chat_id": chat_id,
-                    "user_id": user_id,
-                    "title": title,
-                    "model": mission_model,
-                    "mission_info": mission_info,
-                    "messages": relevant_messages,
-                    "message_count": mission_message_count,
-                    "user_message_count": mission_user_message_count,
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                    "completed": completed,
-                }
-                mission_data["attempt_id"] = self._build_attempt_identifier(chat_id, mission_model, mission_info, i)
+        for mission_model, mission_info, mission_key in candidates:
+            completed = mission_key in completed_keys
+
+            if status_filter == "completed" and not completed:
+                continue
+            if status_filter == "attempted" and completed:
+                continue
 
+            mission_messages = mission_message_map.get(mission_model, [])
+            if mission_messages:
+                relevant_messages = mission_messages
+            else:
+                relevant_messages = [
+                    msg for msg in messages if self._canonical_mission_key(self._get_message_mission_id(msg)) == mission_key
+                ]
+                if not relevant_messages and len(conversation_missions) == 1:
+                    relevant_messages = messages
+
+            mission_message_count = len(relevant_messages)
+            mission_user_message_count = self._count_user_messages(relevant_messages)
+
+            chat_id = item.get("id") or chat.get("id") or item.get("chat_id") or f"chat-{i}"
+            mission_data = {
+                "chat_num": i,
+                "chat_id": chat_id,
+                "user_id": user_id,
+                "title": title,
+                "model": mission_model,
+                "mission_info": mission_info,
+                "messages": relevant_messages,
+                "message_count": mission_message_count,
+                "user_message_count": mission_user_message_count,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "completed": completed,
+            }
+            mission_data["attempt_id"] = self._build_attempt_identifier(chat_id, mission_model, mission_info, i)
+
+            # Details depend only on the mission model, so they are built once
+            # per model; _register_mission_attempt copies them per user.
+            mission_detail = self._mission_detail_cache.get(mission_model)
+            if mission_detail is None:
                 mission_detail = {
                     "name": mission_info["mission_id"],
                     "week": mission_info["week"],
                     "mission_id": mission_info["mission_id"],
                 }
+                self._mission_detail_cache[mission_model] = mission_detail
 
-                self._register_mission_attempt(
-                    mission_data=mission_data,
-                    mission_detail=mission_detail,
-                    mission_key=mission_key,
-                    completed=completed,
-                    created_at=created_at,
-                    updated_at=updated_at,
-                )
+            attempts.append((mission_data, mission_detail, mission_key))
 
-        return len(self.mission_chats)
+        return user_id, attempts
+
+    def _get_data_user_ids(self):
+        """
+        Return known user ids from ``self.data`` in first-seen order.
+
+        Reuses the list gathered by the last ``analyze_missions`` pass when
+        ``self.data`` is unchanged; otherwise rescans the dataset.
+        """
+        source = self._data_user_ids_source
+        if source is None or source[0] is not self.data or source[1] != len(self.data):
+            user_ids = {}
+            for item in self.data:
+                user_id = item.get("user_id", "Unknown")
+                if user_id and user_id != "Unknown":
+                    user_ids[user_id] = None
+            self._data_user_ids = list(user_ids)
+            self._data_user_ids_source = (self.data, len(self.data))
+        return self._data_user_ids
 
     def export_challenge_attempts(self):
         """
         Return a serializable copy of detected mission attempts for persistence.
+
+        Records and their ``mission_info`` are fresh copies; message dicts are
+        shared with the analyzed chats and should be treated as read-only.
         """
         attempts = []
         for mission_chat in self.mission_chats:
-            record = deepcopy(mission_chat)
+            record = _copy_attempt_record(mission_chat)
             if "attempt_id" not in record:
                 record["attempt_id"] = self._build_attempt_identifier(
                     record.get("chat_id"),
@@ -960,15 +1282,19 @@ class MissionAnalyzer:
         Populate mission statistics from precomputed challenge attempts.
         """
         self.mission_chats = []
-        self.user_stats = defaultdict(self._create_user_stats_entry)
+        self.user_stats = _UserStatsTable(self._create_user_stats_entry)
+        status_filter, week_filter = self._normalize_attempt_filters(filter_status, filter_week)
 
         for attempt in attempt_records:
             if not isinstance(attempt, dict):
                 continue
-            mission_data = deepcopy(attempt)
+            mission_data = _copy_attempt_record(attempt)
             user_id = mission_data.get("user_id")
             if not user_id:
                 continue
+            if isinstance(user_id, str):
+                user_id = sys.intern(user_id)
+                mission_data["user_id"] = user_id
             if filter_user and user_id != filter_user:
                 continue
 
@@ -982,18 +1308,16 @@ class MissionAnalyzer:
                 mission_data["mission_info"] = mission_info
 
             completed = bool(mission_data.get("completed"))
-            if filter_status and filter_status.lower() != "not_attempted":
-                status_filter = filter_status.lower()
-                if status_filter == "completed" and not completed:
-                    continue
-                if status_filter == "attempted" and completed:
-                    continue
+            if status_filter == "completed" and not completed:
+                continue
+            if status_filter == "attempted" and completed:
+                continue
 
-            if filter_week:
+            if week_filter is not None:
                 model_week = mission_info.get("week")
                 if model_week is None:
                     model_week = self._lookup_week_for_model(mission_model)
-                if not model_week or str(model_week) != str(filter_week):
+                if not model_week or str(model_week) != week_filter:
                     continue
 
             if mission_info.get("week") is None:
@@ -1033,13 +1357,16 @@ class MissionAnalyzer:
 
         return len(self.mission_chats)
 
-    def get_leaderboard(self, sort_by="completions"):
+    def get_leaderboard(self, sort_by="completions", limit=None):
         """
         Produce a mission leaderboard with selectable ordering.
 
         Args:
             sort_by (str): One of ``"completions"``, ``"attempts"``, or
                 ``"efficiency"``. Defaults to completions.
+            limit (int | None): Return only the top ``limit`` entries. Uses a
+                partial heap selection instead of a full sort; ``None`` keeps
+                every user.
 
         Returns:
             list[dict]: Each entry contains mission attempt/completion counts,
@@ -1057,6 +1384,21 @@ class MissionAnalyzer:
         """
         leaderboard = []
 
+        # Every available mission, deduplicated across aliases, as (mission_id, week).
+        # Built once per call; each user's "not started" list filters this.
+        mission_catalogue = []
+        seen_catalogue = set()
+        for mission_alias in self.mission_model_aliases:
+            # Extract mission info using the same logic as when missions are attempted
+            mission_info = self.extract_mission_info(mission_alias)
+            mission_id = mission_info["mission_id"]
+            if mission_id in seen_catalogue:
+                continue
+            seen_catalogue.add(mission_id)
+            mission_catalogue.append((mission_id, mission_info.get("week")))
+
+        # Completed models repeat across users; resolve their points once.
+        points_by_model = {}
         for user_id, stats in self.user_stats.items():
             # Calculated percentages drive the efficiency leaderboard view.
             efficiency = (
@@ -1066,36 +1408,19 @@ class MissionAnalyzer:
             # Calculate total points from completed missions
             total_points = 0
             for mission_model in stats["completed_mission_models"]:
-                # Try to get points for this model using various lookups
-                points = self.points_mapping.get(mission_model)
-
-                # Try the primary identifier
-                if points is None:
-                    primary = self._resolve_primary_identifier(mission_model)
-                    if primary:
-                        points = self.points_mapping.get(primary)
-
-                # Try the resolved alias
-                if points is None:
-                    alias = self._resolve_alias(mission_model)
-                    if alias:
-                        points = self.points_mapping.get(alias)
-
-                # Try lowercase variation
-                if points is None:
-                    model_lower = str(mission_model).lower()
-                    for key, val in self.points_mapping.items():
-                        if key.lower() == model_lower:
-                            points = val
-                            break
+                points = points_by_model.get(mission_model, _MISSING)
+                if points is _MISSING:
+                    points = self._lookup_mapping(
+                        mission_model, self.points_mapping, self._points_mapping_lower, allow_falsy=True
+                    )
+                    points_by_model[mission_model] = points
 
                 if points is not None:
                     total_points += points
 
             # Calculate attempted missions (only those NOT completed)
-            attempted_set = set(stats["missions_attempted"])
-            completed_set = set(stats["missions_completed"])
-            attempted_only_set = attempted_set - completed_set
+            completed_set = stats["missions_completed"]
+            attempted_only_set = stats["missions_attempted"] - completed_set
 
             # Get detailed lists, removing duplicates by mission_id
             attempted_details_map = {}
@@ -1123,29 +1448,12 @@ class MissionAnalyzer:
             # Get all missions that were started (attempted or completed)
             all_started_mission_ids = set(attempted_details_map.keys()) | set(completed_details_map.keys())
 
-            # Build not started details, avoiding duplicates
-            not_started_details = []
-            seen_not_started = set()
-
-            for mission_alias in self.mission_model_aliases:
-                # Extract mission info using the same logic as when missions are attempted
-                mission_info = self.extract_mission_info(mission_alias)
-                mission_id = mission_info["mission_id"]
-
-                # Skip if this mission was already attempted or completed
-                if mission_id in all_started_mission_ids:
-                    continue
-
-                # Skip if we've already added this mission (avoid duplicates from multiple aliases)
-                if mission_id in seen_not_started:
-                    continue
-
-                seen_not_started.add(mission_id)
-                not_started_details.append({
-                    "name": mission_id,
-                    "week": mission_info.get("week"),
-                    "mission_id": mission_id
-                })
+            # Build not started details from the shared catalogue
+            not_started_details = [
+                {"name": mission_id, "week": week, "mission_id": mission_id}
+                for mission_id, week in mission_catalogue
+                if mission_id not in all_started_mission_ids
+            ]
 
             leaderboard.append(
                 {
@@ -1167,13 +1475,22 @@ class MissionAnalyzer:
             )
 
         # Sort based on criteria
-        if sort_by == "completions":
-            leaderboard.sort(key=lambda x: (x["completions"], -x["attempts"]), reverse=True)
-        elif sort_by == "attempts":
-            leaderboard.sort(key=lambda x: x["attempts"], reverse=True)
-        elif sort_by == "efficiency":
-            leaderboard.sort(key=lambda x: (x["efficiency"], x["completions"]), reverse=True)
-
+        # itemgetter builds keys in C; the completions order negates attempts
+        # (fewest attempts first on ties), which needs the lambda.
+        sort_keys = {
+            "completions": lambda x: (x["completions"], -x["attempts"]),
+            "attempts": itemgetter("attempts"),
+            "efficiency": itemgetter("efficiency", "completions"),
+        }
+        sort_key = sort_keys.get(sort_by)
+
+        if limit is not None:
+            if sort_key is None:
+                return leaderboard[:limit]
+            # Same result and tie order as sorted(..., reverse=True)[:limit].
+            return heapq.nlargest(limit, leaderboard, key=sort_key)
+        if sort_key is not None:
+            leaderboard.sort(key=sort_key, reverse=True)
         return leaderboard
 
     def get_summary(self):
@@ -1190,85 +1507,37 @@ class MissionAnalyzer:
         """
         total_attempts = len(self.mission_chats)
 
-        unique_completion_pairs = set()
-        for chat in self.mission_chats:
-            if not chat["completed"]:
-                continue
-            mission_key = self._canonical_mission_key(chat["model"])
-            if mission_key is None and chat["mission_info"]["mission_id"]:
-                mission_key = str(chat["mission_info"]["mission_id"]).lower()
-            if mission_key is None and chat.get("model") is not None:
-                mission_key = str(chat["model"]).lower()
-            unique_completion_pairs.add((chat["user_id"], mission_key))
-
-        total_completions = len(unique_completion_pairs)
+        aggregates = self._aggregate_mission_chats()
+        unique_missions = aggregates["missions"]
+        unique_weeks = aggregates["weeks"]
+        total_completions = len(aggregates["completion_pairs"])
         unique_users = len(self.user_stats)
 
         success_rate = (total_completions / total_attempts * 100) if total_attempts > 0 else 0
 
-        # Get unique missions and weeks from attempted chats
-        unique_missions = set()
-        unique_weeks = set()
-        for chat in self.mission_chats:
-            unique_missions.add(chat["mission_info"]["mission_id"])
-            week = chat["mission_info"]["week"]
-            if week is not None:
-                unique_weeks.add(week)
-
         # Build missions_list from all models with "Missions" tag (from Open WebUI API)
         # This shows ALL available mission models, not just the ones that have been attempted
         missions_with_weeks = {}  # mission_name -> week
         if self.mission_model_aliases:
-            missions_list = []
-            seen_names = set()
+            seen_names = {}  # mission_name -> week of its first alias (None if unmapped)
             for alias in self.mission_model_aliases:
                 # Get the friendly name for this mission model
                 display_name = self.model_lookup.get(alias, alias)
                 if display_name not in seen_names:
-                    missions_list.append(display_name)
-                    seen_names.add(display_name)
-
                     # Get week for this mission from week_mapping - try multiple identifier variations
-                    week = self.week_mapping.get(alias)
-
-                    # Try the primary identifier
-                    if not week:
-                        primary = self._resolve_primary_identifier(alias)
-                        if primary:
-                            week = self.week_mapping.get(primary)
-
-                    # Try the resolved alias
-                    if not week:
-                        resolved = self._resolve_alias(alias)
-                        if resolved:
-                            week = self.week_mapping.get(resolved)
-
-                    # Try lowercase variation
-                    if not week:
-                        alias_lower = str(alias).lower()
-                        for key, val in self.week_mapping.items():
-                            if key.lower() == alias_lower:
-                                week = val
-                                break
-
-                    if week:
-                        missions_with_weeks[display_name] = str(week)
-            missions_list = sorted(missions_list)
+                    seen_names[display_name] = self._lookup_mapping(alias, self.week_mapping, self._week_mapping_lower)
+            missions_list = sorted(seen_names)
+            missions_with_weeks = {name: week for name, week in seen_names.items() if week}
         else:
             # Fallback: if no models with "Missions" tag found, use model IDs from chat records
             missions_list = sorted(unique_missions)
 
         # Get unique users with their names from ALL chats (not just mission participants)
-        users_list = []
-        seen_users = set()
-        for item in self.data:
-            user_id = item.get("user_id", "Unknown")
-            if user_id and user_id not in seen_users and user_id != "Unknown":
-                users_list.append({
-                    "user_id": user_id,
-                    "user_name": self.get_user_name(user_id)
-                })
-                seen_users.add(user_id)
+        users_list = [
+            {"user_id": user_id, "user_name": self.get_user_name(user_id)}
+            for user_id in self._get_data_user_ids()
+        ]
+        seen_users = {entry["user_id"] for entry in users_list}
 
         if not users_list:
             for user_id in self.user_stats.keys():
@@ -1293,10 +1562,103 @@ class MissionAnalyzer:
             "unique_missions": len(unique_missions),
             "missions_list": missions_list,
             "missions_with_weeks": missions_with_weeks,
-            "weeks_list": sorted(list(unique_weeks)),
+            "weeks_list": sorted(unique_weeks),
             "users_list": users_list,
         }
 
+    def _aggregate_mission_chats(self):
+        """
+        Count attempts per mission, plus the weeks and (user, mission)
+        completions, in one pass over ``self.mission_chats``.
+
+        ``get_summary`` and ``get_mission_breakdown`` both build on this pass.
+        """
+        missions = {}
+        unique_weeks = set()
+        completion_pairs = set()
+        # Bound once: the loop runs per attempt.
+        add_week = unique_weeks.add
+        add_completion_pair = completion_pairs.add
+        canonical_mission_key = self._canonical_mission_key
+
+        for chat in self.mission_chats:
+            mission_info = chat["mission_info"]
+            mission_id = mission_info["mission_id"]
+            user_id = chat["user_id"]
+            mission_model = chat["model"]
+            week = mission_info["week"]
+            if week is not None:
+                add_week(week)
+
+            stats = missions.get(mission_id)
+            if stats is None:
+                stats = missions[mission_id] = {
+                    "attempts": 0,
+                    "completions": 0,
+                    "users": set(),
+                    "users_completed": set(),
+                    "mission_model": None,  # Store the model identifier for metadata lookup
+                }
+            stats["attempts"] += 1
+            stats["users"].add(user_id)
+            # Store the first mission_model we encounter for this mission
+            if stats["mission_model"] is None:
+                stats["mission_model"] = mission_model
+
+            if chat["completed"]:
+                stats["completions"] += 1
+                stats["users_completed"].add(user_id)
+
+                mission_key = canonical_mission_key(mission_model)
+                if mission_key is None and mission_id:
+                    mission_key = str(mission_id).lower()
+                if mission_key is None and mission_model is not None:
+                    mission_key = str(mission_model).lower()
+                add_completion_pair((user_id, mission_key))
+
+        return {
+            "missions": missions,
+            "weeks": unique_weeks,
+            "completion_pairs": completion_pairs,
+        }
+
+    def _mission_completion_totals(self):
+        """
+        Return ``{mission_id: [completed_users, attempts_to_complete, messages_to_complete]}``.
+
+        Used by ``get_mission_breakdown``.
+        """
+        # Calculate per-user completion metrics. One stable sort by created_at
+        # orders every (mission, user) group exactly as sorting each group would;
+        # per group, attempts and messages accumulate up to the first completion.
+        progress = {}  # (mission_id, user_id) -> [num_attempts, num_messages]; None once completed
+        completion_totals = {}
+        get_progress = progress.get
+        for chat in sorted(self.mission_chats, key=_created_at_sort_key):
+            mission_id = chat["mission_info"]["mission_id"]
+            key = (mission_id, chat["user_id"])
+            state = get_progress(key, _MISSING)
+            if state is None:
+                continue
+            if state is _MISSING:
+                state = progress[key] = [0, 0]
+
+            state[0] += 1
+            user_message_count = chat.get("user_message_count", _MISSING)
+            if user_message_count is _MISSING:
+                user_message_count = self._count_user_messages(chat.get("messages", []))
+            state[1] += user_message_count
+
+            if chat["completed"]:
+                totals = completion_totals.get(mission_id)
+                if totals is None:
+                    totals = completion_totals[mission_id] = [0, 0, 0]
+                totals[0] += 1
+                totals[1] += state[0]
+                totals[2] += state[1]
+                progress[key] = None
+        return completion_totals
+
     def get_mission_breakdown(self):
         """
         Return mission-level attempt and completion counts.
@@ -1311,64 +1673,8 @@ class MissionAnalyzer:
         Usage:
             Feed directly into dashboard tables or CSV exports.
         """
-        breakdown = defaultdict(lambda: {
-            "attempts": 0,
-            "completions": 0,
-            "users": set(),
-            "users_completed": set(),
-            "user_completion_data": [],  # List of {user_id, num_attempts, num_messages}
-            "mission_model": None  # Store the model identifier for metadata lookup
-        })
-
-        # Track per-user, per-mission attempts
-        user_mission_attempts = defaultdict(lambda: defaultdict(list))  # mission_id -> user_id -> [chats]
-
-        for chat in self.mission_chats:
-            mission_id = chat["mission_info"]["mission_id"]
-            user_id = chat["user_id"]
-            mission_model = chat["model"]
-
-            breakdown[mission_id]["attempts"] += 1
-            breakdown[mission_id]["users"].add(user_id)
-            # Store the first mission_model we encounter for this mission
-            if breakdown[mission_id]["mission_model"] is None:
-                breakdown[mission_id]["mission_model"] = mission_model
-            user_mission_attempts[mission_id][user_id].append(chat)
-
-            if chat["completed"]:
-                breakdown[mission_id]["completions"] += 1
-                breakdown[mission_id]["users_completed"].add(user_id)
-
-        # Calculate per-user completion metrics
-        for mission_id, user_chats_map in user_mission_attempts.items():
-            for user_id, chats in user_chats_map.items():
-                # Sort chats by created_at to find first completion
-                sorted_chats = sorted(chats, key=lambda x: x.get("created_at") or 0)
-
-                # Find first completed chat
-                completed_idx = None
-                for idx, chat in enumerate(sorted_chats):
-                    if chat["completed"]:
-                        completed_idx = idx
-                        break
-
-                if completed_idx is not None:
-                    # User completed this mission
-                    # Count attempts up to and including completion
-                    num_attempts = completed_idx + 1
-                    # Count messages up to and including completion
-                    num_messages = 0
-                    for conversation in sorted_chats[:num_attempts]:
-                        if "user_message_count" in conversation:
-                            num_messages += conversation["user_message_count"]
-                        else:
-                            num_messages += self._count_user_messages(conversation.get("messages", []))
-
-                    breakdown[mission_id]["user_completion_data"].append({
-                        "user_id": user_id,
-                        "num_attempts": num_attempts,
-                        "num_messages": num_messages
-                    })
+        breakdown = self._aggregate_mission_chats()["missions"]
+        completion_totals = self._mission_completion_totals()
 
         # Get total users in system
         total_users = len(set(item.get("user_id", "Unknown") for item in self.data if item.get("user_id") != "Unknown"))
@@ -1383,49 +1689,22 @@ class MissionAnalyzer:
             # Calculate averages for completed users
             avg_messages_to_complete = 0.0
             avg_attempts_to_complete = 0.0
-            if stats["user_completion_data"]:
-                avg_messages_to_complete = sum(d["num_messages"] for d in stats["user_completion_data"]) / len(stats["user_completion_data"])
-                avg_attempts_to_complete = sum(d["num_attempts"] for d in stats["user_completion_data"]) / len(stats["user_completion_data"])
+            totals = completion_totals.get(mission_id)
+            if totals is not None:
+                avg_messages_to_complete = totals[2] / totals[0]
+                avg_attempts_to_complete = totals[1] / totals[0]
 
-            # Look up mission metadata (week, difficulty, points)
+            # Look up mission metadata (week, difficulty, points); the mappings
+            # are coerced to str/int once in __init__
             mission_model = stats["mission_model"]
             week = None
             difficulty = None
             points = None
 
             if mission_model:
-                # Try to get week
-                week = self.week_mapping.get(mission_model)
-                if not week:
-                    primary = self._resolve_primary_identifier(mission_model)
-                    if primary:
-                        week = self.week_mapping.get(primary)
-                if not week:
-                    alias = self._resolve_alias(mission_model)
-                    if alias:
-                        week = self.week_mapping.get(alias)
-
-                # Try to get points
-                points = self.points_mapping.get(mission_model)
-                if points is None:
-                    primary = self._resolve_primary_identifier(mission_model)
-                    if primary:
-                        points = self.points_mapping.get(primary)
-                if points is None:
-                    alias = self._resolve_alias(mission_model)
-                    if alias:
-                        points = self.points_mapping.get(alias)
-
-                # Try to get difficulty
-                difficulty = self.difficulty_mapping.get(mission_model)
-                if not difficulty:
-                    primary = self._resolve_primary_identifier(mission_model)
-                    if primary:
-                        difficulty = self.difficulty_mapping.get(primary)
-                if not difficulty:
-                    alias = self._resolve_alias(mission_model)
-                    if alias:
-                        difficulty = self.difficulty_mapping.get(alias)
+                week = self._lookup_mapping(mission_model, self.week_mapping)
+                points = self._lookup_mapping(mission_model, self.points_mapping, allow_falsy=True)
+                difficulty = self._lookup_mapping(mission_model, self.difficulty_mapping)
 
             result.append(
                 {
@@ -1439,15 +1718,29 @@ class MissionAnalyzer:
                     "users_not_started": users_not_started,
                     "avg_messages_to_complete": avg_messages_to_complete,
                     "avg_attempts_to_complete": avg_attempts_to_complete,
-                    "week": str(week) if week else "",
-                    "difficulty": str(difficulty) if difficulty else "",
-                    "points": int(points) if points is not None else 0,
+                    "week": week or "",
+                    "difficulty": difficulty or "",
+                    "points": points if points is not None else 0,
                 }
             )
 
         result.sort(key=lambda x: x["attempts"], reverse=True)
         return result
 
+    @staticmethod
+    def _new_challenge_entry(user_id, user_name=""):
+        """
+        Build the per-user participation record used by ``get_challenge_results``.
+        """
+        return {
+            "user_id": user_id,
+            "user_name": user_name,
+            "conversations": [],  # List of conversation metadata
+            "completed": False,
+            "completion_time": None,
+            "completion_message_index": None,
+        }
+
     def get_challenge_results(self, filter_challenge=None, filter_status=None):
         """
         Generate per-user challenge results when a specific challenge filter is active.
@@ -1480,21 +1773,11 @@ class MissionAnalyzer:
             return []
 
         # Track per-user challenge participation
-        user_challenge_data = defaultdict(lambda: {
-            "user_id": "",
-            "user_name": "",
-            "conversations": [],  # List of conversation metadata
-            "completed": False,
-            "completion_time": None,
-            "completion_message_index": None,
-        })
+        user_challenge_data = {}
 
-        # First pass: collect all users from the entire dataset
-        all_users = set()
-        for item in self.data:
-            user_id = item.get("user_id", "Unknown")
-            if user_id and user_id != "Unknown":
-                all_users.add(user_id)
+        # First pass: collect all users from the entire dataset (cached by
+        # analyze_missions, so this does not rescan self.data)
+        all_users = set(self._get_data_user_ids())
 
         if not all_users:
             for chat in self.mission_chats:
@@ -1507,33 +1790,39 @@ class MissionAnalyzer:
 
         # Initialize all users in the challenge data
         for user_id in all_users:
-            user_challenge_data[user_id]["user_id"] = user_id
-            user_challenge_data[user_id]["user_name"] = self.get_user_name(user_id)
+            user_challenge_data[user_id] = self._new_challenge_entry(user_id, self.get_user_name(user_id))
 
-        # Second pass: collect all conversations for this challenge
+        # Second pass: collect all conversations for this challenge. Exports
+        # hold few distinct mission models, so the filter is evaluated once
+        # per model and later chats only probe model_matches.
+        challenge_chats = []
+        model_matches = {}
         for chat in self.mission_chats:
             user_id = chat["user_id"]
             mission_model = chat["model"]
 
             # Check if this chat matches the challenge filter
-            if not self._mission_matches_filter(mission_model, filter_challenge):
+            if isinstance(mission_model, str):
+                matched = model_matches.get(mission_model)
+                if matched is None:
+                    matched = model_matches[mission_model] = self._mission_matches_filter(
+                        mission_model, filter_challenge
+                    )
+            else:
+                matched = self._mission_matches_filter(mission_model, filter_challenge)
+            if not matched:
                 continue
 
-            # Store conversation metadata
-            conv_data = {
-                "created_at": chat["created_at"],
-                "message_count": chat["message_count"],
-                "user_message_count": chat.get("user_message_count", self._count_user_messages(chat.get("messages", []))),
-                "completed": chat["completed"],
-                "messages": chat["messages"],
-            }
-            user_challenge_data[user_id]["conversations"].append(conv_data)
-            if not user_challenge_data[user_id]["user_name"]:
-                user_challenge_data[user_id]["user_name"] = self.get_user_name(user_id)
+            challenge_chats.append(chat)
+            entry = user_challenge_data.get(user_id)
+            if entry is None:
+                entry = user_challenge_data[user_id] = self._new_challenge_entry(user_id)
+            if not entry["user_name"]:
+                entry["user_name"] = self.get_user_name(user_id)
 
             # Track completion
-            if chat["completed"] and not user_challenge_data[user_id]["completed"]:
-                user_challenge_data[user_id]["completed"] = True
+            if chat["completed"] and not entry["completed"]:
+                entry["completed"] = True
                 # Find the exact message that triggered success
                 first_assistant_seen = False
                 for idx, msg in enumerate(chat["messages"]):
@@ -1542,17 +1831,32 @@ class MissionAnalyzer:
                     if not first_assistant_seen:
                         first_assistant_seen = True
                         continue
-                    content = msg.get("content", "").lower()
-                    if any(keyword in content for keyword in self.success_keywords):
-                        user_challenge_data[user_id]["completion_time"] = chat["created_at"]
-                        user_challenge_data[user_id]["completion_message_index"] = idx
+                    if _SUCCESS_KEYWORD_RE.search(msg.get("content", "").lower()):
+                        entry["completion_time"] = chat["created_at"]
+                        entry["completion_message_index"] = idx
                         break
 
+        # Store conversation metadata in timestamp order. One stable sort of
+        # the challenge's chats leaves every user's conversations ordered as
+        # sorting each user's list would. The stored user_message_count is
+        # preferred; only legacy records without it are recounted.
+        challenge_chats.sort(key=lambda x: x["created_at"] or 0)
+        for chat in challenge_chats:
+            user_message_count = chat.get("user_message_count", _MISSING)
+            if user_message_count is _MISSING:
+                user_message_count = self._count_user_messages(chat.get("messages", []))
+            user_challenge_data[chat["user_id"]]["conversations"].append({
+                "created_at": chat["created_at"],
+                "message_count": chat["message_count"],
+                "user_message_count": user_message_count,
+                "completed": chat["completed"],
+                "messages": chat["messages"],
+            })
+
         # Third pass: calculate metrics for each user
         results = []
         for user_id, data in user_challenge_data.items():
-            # Sort conversations by timestamp
-            conversations = sorted(data["conversations"], key=lambda x: x["created_at"] or 0)
+            conversations = data["conversations"]
 
             if not conversations:
                 # User hasn't attempted this challenge
@@ -1648,11 +1952,18 @@ def find_latest_export():
     if not DATA_DIR.exists():
         return None
 
-    json_files = sorted(DATA_DIR.glob("all-chats-export-*.json"), reverse=True)
-    if not json_files:
-        return None
-    # Sort by filename (timestamp in filename)
-    return str(json_files[0])
+    # Newest by filename (timestamp in filename); a linear max, no sort.
+    with os.scandir(DATA_DIR) as entries:
+        latest = max(
+            (
+                entry.path
+                for entry in entries
+                if entry.name.startswith("all-chats-export-") and entry.name.endswith(".json")
+            ),
+            key=os.path.basename,
+            default=None,
+        )
+    return latest
 
 
 if __name__ == "__main__":
@@ -1701,9 +2012,9 @@ if __name__ == "__main__":
         # Show leaderboard
         print("\nTOP PERFORMERS (by completions):")
         print("-" * 80)
-        leaderboard = analyzer.get_leaderboard(sort_by="completions")
+        leaderboard = analyzer.get_leaderboard(sort_by="completions", limit=10)
 
-        for i, user in enumerate(leaderboard[:10], 1):
+        for i, user in enumerate(leaderboard, 1):
             print(f"{i}. User: {user['user_id'][:30]}...")
             print(
                 f"   Completions: {user['completions']} | Attempts: {user['attempts']} | "
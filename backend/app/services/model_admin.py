@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -168,6 +168,17 @@ def collect_model_identifiers(model: Model) -> set[str]:
     return identifiers
 
 
+def collect_all_model_identifiers(models: Iterable[Model]) -> List[Tuple[str, str]]:
+    """Return ``(alias_lower, week)`` pairs for every model that has a MAIP week."""
+    pairs: List[Tuple[str, str]] = []
+    for model in models:
+        if model.maip_week is None:
+            continue
+        week = str(model.maip_week)
+        pairs.extend((identifier.lower(), week) for identifier in collect_model_identifiers(model))
+    return pairs
+
+
 def update_model(session: Session, model_id: str, updates: dict) -> Model:
     model = session.get(Model, model_id)
     if not model:
@@ -12,6 +12,7 @@ if str(PROJECT_ROOT) not in sys.path:
 os.environ.setdefault("SESSION_SECRET", "test-secret")
 os.environ.setdefault("DB_NAME", "test_chats.sqlite")
 
+from backend.app.db import crud  # noqa: E402
 from backend.app.db.models import Chat, User  # noqa: E402
 from backend.app.db.session import (  # noqa: E402
     DATA_DIR,
@@ -20,7 +21,12 @@ from backend.app.db.session import (  # noqa: E402
     engine,
     get_engine_info,
 )
-from backend.app.services.data_store import persist_chats, persist_users  # noqa: E402
+from backend.app.services.data_store import (  # noqa: E402
+    get_latest_status,
+    get_recent_logs,
+    persist_chats,
+    persist_users,
+)
 
 
 def _cleanup_db() -> None:
@@ -104,3 +110,28 @@ def test_persist_users_overrides_placeholder_data() -> None:
         assert stored_user.data["name"] == "Mission Specialist"
     finally:
         session.close()
+
+
+def test_reload_log_is_visible_after_persist() -> None:
+    persist_users([{"id": "user-log", "name": "Logged User"}])
+
+    latest = get_latest_status("users")
+    assert latest is not None
+    assert latest.status == "success"
+    assert latest.rows_affected == 1
+    assert latest.total_count == 1
+
+
+def test_failed_reload_log_batch_is_retried(monkeypatch) -> None:
+    def fail_insert(session, entries):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(crud, "insert_reload_logs", fail_insert)
+    persist_users([{"id": "user-retry", "name": "Retried User"}])
+    with pytest.raises(RuntimeError):
+        get_recent_logs()
+
+    monkeypatch.undo()
+    latest = get_latest_status("users")
+    assert latest is not None
+    assert latest.rows_affected == 1
@@ -0,0 +1,183 @@
+import sys
+from pathlib import Path
+
+# Ensure project root importable
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.app.services.mission_analyzer import MissionAnalyzer  # noqa: E402
+
+MISSION_MODEL = "maip---week-1---challenge-1"
+
+
+def _build_analyzer(data):
+    return MissionAnalyzer(
+        json_file=None,
+        data=data,
+        user_names={"user-123": "Agent Smith"},
+        model_lookup={MISSION_MODEL: "Week 1 Challenge", "gpt-4": "GPT 4"},
+        mission_model_aliases={MISSION_MODEL},
+        model_alias_to_primary={MISSION_MODEL: MISSION_MODEL},
+        week_mapping={MISSION_MODEL: "Week 1"},
+        points_mapping={MISSION_MODEL: 15},
+        difficulty_mapping={MISSION_MODEL: "Easy"},
+        user_names_file="/nonexistent/user_names.json",
+        verbose=False,
+    )
+
+
+def _chat(chat_id, user_id, model, replies, created_at=1):
+    messages = [{"role": "user", "content": "start"}]
+    for reply in replies:
+        messages.append({"role": "assistant", "content": reply, "model": model})
+        messages.append({"role": "user", "content": "next"})
+    return {
+        "id": chat_id,
+        "user_id": user_id,
+        "title": chat_id,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "chat": {"models": [model], "messages": messages},
+    }
+
+
+def test_success_keyword_detection_is_case_insensitive_and_skips_intro():
+    analyzer = _build_analyzer([])
+    intro_only = [{"role": "assistant", "content": "Mission Accomplished"}]
+    assert not analyzer.check_success(intro_only)
+
+    messages = [
+        {"role": "assistant", "content": "Welcome, agent."},
+        {"role": "user", "content": "attempt"},
+        {"role": "assistant", "content": "... CHALLENGES COMPLETED ..."},
+    ]
+    assert analyzer.check_success(messages)
+    messages[-1]["content"] = "challenge complet"
+    assert not analyzer.check_success(messages)
+
+
+def test_mission_success_counts_any_reply_after_the_mission_intro():
+    analyzer = _build_analyzer([])
+    other = "maip---week-2---challenge-1"
+    messages = [
+        {"role": "assistant", "content": "Mission complete", "model": other},
+        {"role": "assistant", "content": "Welcome", "model": MISSION_MODEL},
+        {"role": "assistant", "content": "mission accomplished", "model": MISSION_MODEL},
+        {"role": "user", "content": "thanks"},
+        {"role": "assistant", "content": "Anything else?", "model": MISSION_MODEL},
+    ]
+    assert analyzer.check_success(messages)
+    assert analyzer.check_success(messages, mission_model=MISSION_MODEL)
+    assert not analyzer.check_success(messages, mission_model=other)
+    assert analyzer._completed_mission_keys(messages, {MISSION_MODEL, other}) == {MISSION_MODEL}
+
+
+def test_mission_detection_uses_aliases_and_patterns():
+    analyzer = _build_analyzer([])
+    assert analyzer.get_mission_model_id(MISSION_MODEL.upper()) == MISSION_MODEL
+    assert analyzer.is_mission_model("my-mission-bot")
+    assert not analyzer.is_mission_model("gpt-4")
+    info = analyzer.extract_mission_info(MISSION_MODEL)
+    assert info == {"model": MISSION_MODEL, "week": 1, "challenge": 1, "mission_id": "Week 1 Challenge"}
+    info["week"] = 99
+    assert analyzer.extract_mission_info(MISSION_MODEL)["week"] == 1
+
+
+def test_analyze_missions_aggregates_attempts_and_filters():
+    data = [
+        _chat("c1", "user-123", MISSION_MODEL, ["intro", "try again"], created_at=1),
+        _chat("c2", "user-123", MISSION_MODEL, ["intro", "Mission complete!"], created_at=2),
+        _chat("c3", "user-456", MISSION_MODEL, ["intro"], created_at=3),
+        _chat("c4", "user-456", "gpt-4", ["intro", "mission complete"], created_at=4),
+    ]
+    analyzer = _build_analyzer(data)
+
+    assert analyzer.analyze_missions() == 3
+    leaderboard = analyzer.get_leaderboard()
+    assert [entry["user_id"] for entry in leaderboard] == ["user-123", "user-456"]
+    assert leaderboard[0]["completions"] == 1
+    assert leaderboard[0]["total_points"] == 15
+
+    summary = analyzer.get_summary()
+    assert summary["mission_attempts"] == 3
+    assert summary["mission_completions"] == 1
+    assert summary["weeks_list"] == [1]
+
+    breakdown = analyzer.get_mission_breakdown()
+    assert breakdown[0]["attempts"] == 3
+    assert breakdown[0]["avg_attempts_to_complete"] == 2.0
+
+    assert analyzer.analyze_missions(filter_status="completed") == 1
+    assert analyzer.analyze_missions(filter_user="user-456") == 1
+    assert analyzer.analyze_missions(filter_week="2") == 0
+    assert analyzer.analyze_missions(filter_challenge="Week 1 Challenge") == 3
+
+
+def test_mission_breakdown_orders_mixed_timestamp_types():
+    data = [
+        _chat("c1", "user-123", MISSION_MODEL, ["intro", "Mission complete!"], created_at="1970-01-01T00:00:05Z"),
+        _chat("c2", "user-123", MISSION_MODEL, ["intro", "retry"], created_at=2),
+        _chat("c3", "user-456", MISSION_MODEL, ["intro", "Mission complete!"], created_at="3"),
+        _chat("c4", "user-456", MISSION_MODEL, ["intro", "retry"], created_at=None),
+    ]
+    analyzer = _build_analyzer(data)
+    analyzer.analyze_missions()
+
+    breakdown = analyzer.get_mission_breakdown()
+    assert breakdown[0]["completions"] == 2
+    assert breakdown[0]["avg_attempts_to_complete"] == 2.0
+
+
+def test_leaderboard_mission_details_are_not_shared_between_users():
+    data = [
+        _chat("c1", "user-123", MISSION_MODEL, ["intro", "Mission complete!"], created_at=1),
+        _chat("c2", "user-456", MISSION_MODEL, ["intro", "retry"], created_at=2),
+    ]
+    analyzer = _build_analyzer(data)
+    analyzer.analyze_missions()
+
+    completed, attempted = analyzer.get_leaderboard()
+    completed["missions_completed_details"][0]["week"] = 99
+    assert attempted["missions_attempted_details"] == [
+        {"name": "Week 1 Challenge", "week": 1, "mission_id": "Week 1 Challenge"}
+    ]
+
+    analyzer.analyze_missions()
+    assert analyzer.get_leaderboard()[0]["missions_completed_details"][0]["week"] == 1
+
+
+def test_report_results_are_fresh_on_every_call():
+    data = [
+        _chat("c1", "user-123", MISSION_MODEL, ["intro", "Mission complete!"], created_at=1),
+        _chat("c2", "user-456", MISSION_MODEL, ["intro", "retry"], created_at=2),
+    ]
+    analyzer = _build_analyzer(data)
+    analyzer.analyze_missions()
+
+    summary = analyzer.get_summary()
+    expected_summary = analyzer.get_summary()
+    summary["mission_attempts"] = 99
+    summary["users_list"].clear()
+    summary["weeks_list"].append(7)
+    assert analyzer.get_summary() == expected_summary
+
+    breakdown = analyzer.get_mission_breakdown()
+    breakdown[0]["attempts"] = 99
+    assert analyzer.get_mission_breakdown()[0]["attempts"] == 2
+
+    results = analyzer.get_challenge_results(filter_challenge=MISSION_MODEL)
+    results[0]["status"] = "Tampered"
+    assert [r["status"] for r in analyzer.get_challenge_results(filter_challenge=MISSION_MODEL)] == [
+        "Completed",
+        "Attempted",
+    ]
+    assert analyzer.get_challenge_results(filter_challenge=MISSION_MODEL, filter_status="completed")[0]["user_id"] == "user-123"
+
+    analyzer.user_names["user-456"] = "Renamed Agent"
+    assert {user["user_name"] for user in analyzer.get_summary()["users_list"]} == {"Agent Smith", "Renamed Agent"}
+    assert analyzer.get_challenge_results(filter_challenge=MISSION_MODEL)[1]["user_name"] == "Renamed Agent"
+
+    analyzer.analyze_missions(filter_status="completed")
+    assert analyzer.get_summary()["mission_attempts"] == 1
+    assert analyzer.get_mission_breakdown()[0]["attempts"] == 1